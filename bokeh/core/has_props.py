@@ -194,15 +194,17 @@ def accumulate_from_superclasses(cls, propname):
     '''
     cachename = "__cached_all" + propname
     # we MUST use cls.__dict__ NOT hasattr(). hasattr() would also look at base
-    # classes, and the cache must be separate for each class
-    if cachename not in cls.__dict__:
-        s = set()
+    # classes, and the cache must be separate for each class. This is called
+    # for every property lookup, so the cached case is a single dict probe
+    cached = cls.__dict__.get(cachename)
+    if cached is None:
+        cached = set()
         for c in cls.__mro__:
             if issubclass(c, HasProps) and hasattr(c, propname):
                 base = getattr(c, propname)
-                s.update(base)
-        setattr(cls, cachename, s)
-    return cls.__dict__[cachename]
+                cached.update(base)
+        setattr(cls, cachename, cached)
+    return cached
 
 def accumulate_dict_from_superclasses(cls, propname):
     ''' Traverse the class hierarchy and accumulate the special dicts
@@ -218,16 +220,17 @@ def accumulate_dict_from_superclasses(cls, propname):
     cachename = "__cached_all" + propname
     # we MUST use cls.__dict__ NOT hasattr(). hasattr() would also look at base
     # classes, and the cache must be separate for each class
-    if cachename not in cls.__dict__:
-        d = dict()
+    cached = cls.__dict__.get(cachename)
+    if cached is None:
+        cached = dict()
         for c in cls.__mro__:
             if issubclass(c, HasProps) and hasattr(c, propname):
                 base = getattr(c, propname)
                 for k,v in base.items():
-                    if k not in d:
-                        d[k] = v
-        setattr(cls, cachename, d)
-    return cls.__dict__[cachename]
+                    if k not in cached:
+                        cached[k] = v
+        setattr(cls, cachename, cached)
+    return cached
 
 class HasProps(object, metaclass=MetaHasProps):
     ''' Base class for all class types that have Bokeh properties.
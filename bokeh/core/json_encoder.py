@@ -8,7 +8,9 @@
 serializing objects for BokehJS.
 
 The primary interface is provided by the |serialize_json| function, which
-uses the custom |BokehJSONEncoder| to produce JSON output.
+uses the custom |BokehJSONEncoder| to produce JSON output. The |to_json_types|
+function performs the same conversions, but returns plain Python objects
+instead of a string.
 
 In general, functions in this module convert values in the following way:
 
@@ -36,6 +38,7 @@ In general, functions in this module convert values in the following way:
 * ``Color`` instances are converted to CSS color values.
 
 .. |serialize_json| replace:: :class:`~bokeh.core.json_encoder.serialize_json`
+.. |to_json_types| replace:: :class:`~bokeh.core.json_encoder.to_json_types`
 .. |BokehJSONEncoder| replace:: :class:`~bokeh.core.json_encoder.BokehJSONEncoder`
 
 '''
@@ -54,6 +57,7 @@ log = logging.getLogger(__name__)
 import collections
 import decimal
 import json
+import math
 
 # External imports
 import numpy as np
@@ -81,6 +85,7 @@ pd = import_optional('pandas')
 __all__ = (
     'BokehJSONEncoder',
     'serialize_json',
+    'to_json_types',
 )
 
 #-----------------------------------------------------------------------------
@@ -164,6 +169,51 @@ def serialize_json(obj, pretty=None, indent=None, **kwargs):
 
     return json.dumps(obj, cls=BokehJSONEncoder, allow_nan=False, indent=indent, separators=separators, sort_keys=True, **kwargs)
 
+def to_json_types(obj):
+    ''' Return a representation of objects that contains only plain JSON
+    types (dict, list, str, int, float, bool and None).
+
+    The result is the same as ``json.loads(serialize_json(obj))``, but is
+    built directly, without first encoding to a string and then parsing it
+    again.
+
+    Args:
+        obj (obj) : the object to convert
+
+    Returns:
+        JSON-data
+
+    Raises:
+        ValueError, if ``obj`` contains NaN or infinite floating point values
+        (these are not permitted by |serialize_json| either)
+
+    '''
+    obj_type = type(obj)
+
+    # fast path for values that are already plain JSON types
+    if obj_type is str or obj_type is int or obj_type is bool or obj is None:
+        return obj
+    if obj_type is float:
+        if math.isnan(obj) or math.isinf(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return obj
+
+    if isinstance(obj, dict):
+        return {_json_key(k): to_json_types(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_json_types(v) for v in obj]
+
+    # subclasses of the basic types are encoded as their base types
+    if isinstance(obj, str):
+        # use the raw string value, not a (e.g. Enum) subclass __str__
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return to_json_types(float(obj))
+
+    return to_json_types(_encoder.default(obj))
+
 
 #-----------------------------------------------------------------------------
 # Dev API
@@ -259,6 +309,28 @@ class BokehJSONEncoder(json.JSONEncoder):
 # Private API
 #-----------------------------------------------------------------------------
 
+_encoder = BokehJSONEncoder()
+
+def _json_key(key):
+    ''' Convert a dict key the same way ``json.dumps`` does.
+
+    '''
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        if math.isnan(key) or math.isinf(key):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return float.__repr__(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError("keys must be str, int, float, bool or None, not %s" % type(key).__name__)
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
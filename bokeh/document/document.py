@@ -34,7 +34,7 @@ log = logging.getLogger(__name__)
 # Standard library imports
 import sys
 from collections import defaultdict
-from functools import wraps
+from functools import partial, update_wrapper, wraps
 from json import loads
 
 # External imports
@@ -42,7 +42,7 @@ import jinja2
 
 # Bokeh imports
 from ..core.enums import HoldPolicy
-from ..core.json_encoder import serialize_json
+from ..core.json_encoder import serialize_json, to_json_types
 from ..core.query import find
 from ..core.templates import FILE
 from ..core.validation import check_integrity
@@ -106,7 +106,9 @@ class Document(object):
         self._all_models = dict()
         self._all_models_by_name = MultiValuedDict()
         self._all_former_model_ids = set()
+        self._root_refs_cache = {}
         self._callbacks = {}
+        self._callbacks_list = ()
         self._session_destroyed_callbacks = set()
         self._session_callbacks = set()
         self._session_context = None
@@ -211,8 +213,14 @@ class Document(object):
         else:
             raise ValueError("Theme must be a string or an instance of the Theme class")
 
+        if not self._all_models:
+            return
+
+        # the theme resolves (and caches) its attributes once per model class,
+        # so all that is left to do here is a single pass over the models
+        apply_to_model = self._theme.apply_to_model
         for model in self._all_models.values():
-            self._theme.apply_to_model(model)
+            apply_to_model(model)
 
     @property
     def title(self):
@@ -300,6 +308,7 @@ class Document(object):
         '''
         if model in self._roots:
             return
+        self._root_refs_cache.pop(id(model), None)
         self._push_all_models_freeze()
         # TODO (bird) Should we do some kind of reporting of how many
         # LayoutDOM's are in the document roots? In vanilla bokeh cases e.g.
@@ -369,12 +378,8 @@ class Document(object):
         '''
         references_json = patch['references']
         events_json = patch['events']
-        references = instantiate_references_json(references_json)
-
         # Use our existing model instances whenever we have them
-        for obj in references.values():
-            if obj.id in self._all_models:
-                references[obj.id] = self._all_models[obj.id]
+        references = instantiate_references_json(references_json, self._all_models)
 
         # The model being changed isn't always in references so add it in
         for event_json in events_json:
@@ -463,8 +468,7 @@ class Document(object):
         '''
         self._push_all_models_freeze()
         try:
-            while len(self._roots) > 0:
-                r = next(iter(self._roots))
+            for r in list(self._roots):
                 self.remove_root(r)
         finally:
             self._pop_all_models_freeze()
@@ -479,6 +483,7 @@ class Document(object):
             del m
 
         self._roots = []
+        self._root_refs_cache.clear()
         self._all_models = None
         self._all_models_by_name = None
         self._theme = None
@@ -593,7 +598,7 @@ class Document(object):
             Model or None
 
         '''
-        return self._all_models_by_name.get_one(name, "Found more than one model named '%s'" % name)
+        return self._all_models_by_name.get_one(name, "Found more than one model named '%s'")
 
     def hold(self, policy="combine"):
         ''' Activate a document hold.
@@ -669,11 +674,15 @@ class Document(object):
 
             _check_callback(callback, ('event',))
 
-            self._callbacks[callback] = callback
+            entry = (callback, False)
+            self._callbacks[callback] = entry
+            self._callbacks_list = self._callbacks_list + (entry,)
 
     def on_change_dispatch_to(self, receiver):
         if not receiver in self._callbacks:
-            self._callbacks[receiver] = lambda event: event.dispatch(receiver)
+            entry = (receiver, True)
+            self._callbacks[receiver] = entry
+            self._callbacks_list = self._callbacks_list + (entry,)
 
     def on_session_destroyed(self, *callbacks):
         ''' Provide callbacks to invoke when the session serving the Document
@@ -707,7 +716,8 @@ class Document(object):
 
         '''
         for callback in callbacks:
-            del self._callbacks[callback]
+            entry = self._callbacks.pop(callback)
+            self._callbacks_list = tuple(e for e in self._callbacks_list if e is not entry)
 
     def remove_periodic_callback(self, callback_obj):
         ''' Remove a callback added earlier with ``add_periodic_callback``
@@ -749,6 +759,7 @@ class Document(object):
         '''
         if model not in self._roots:
             return # TODO (bev) ValueError?
+        self._root_refs_cache.pop(id(model), None)
         self._push_all_models_freeze()
         try:
             self._roots.remove(model)
@@ -799,6 +810,10 @@ class Document(object):
         if self._is_single_string_selector(selector, 'name'):
             # special-case optimization for by-name query
             return self._all_models_by_name.get_all(selector['name'])
+        elif self._is_single_string_selector(selector, 'id'):
+            # special-case optimization for by-id query
+            model = self._all_models.get(selector['id'])
+            return [model] if model is not None else []
         else:
             return find(self._all_models.values(), selector)
 
@@ -815,12 +830,17 @@ class Document(object):
             Model or None
 
         '''
-        result = list(self.select(selector))
-        if len(result) > 1:
-            raise ValueError("Found more than one model matching %s: %r" % (selector, result))
-        if len(result) == 0:
+        # pull at most two results, there is no need to collect every match
+        # unless we are going to report them in an error
+        results = iter(self.select(selector))
+        first = next(results, None)
+        if first is None:
             return None
-        return result[0]
+        second = next(results, None)
+        if second is not None:
+            result = [first, second] + list(results)
+            raise ValueError("Found more than one model matching %s: %r" % (selector, result))
+        return first
 
     def set_select(self, selector, updates):
         ''' Update objects that match a given selector with the specified
@@ -846,11 +866,7 @@ class Document(object):
             JSON-data
 
         '''
-
-        # this is a total hack to go via a string, needed because
-        # our BokehJSONEncoder goes straight to a string.
-        doc_json = self.to_json_string()
-        return loads(doc_json)
+        return to_json_types(self._to_json_like())
 
     def to_json_string(self, indent=None) -> str:
         ''' Convert the document to a JSON string.
@@ -863,22 +879,7 @@ class Document(object):
             str
 
         '''
-        root_ids = []
-        for r in self._roots:
-            root_ids.append(r.id)
-
-        root_references = self._all_models.values()
-
-        json = {
-            'title' : self.title,
-            'roots' : {
-                'root_ids' : root_ids,
-                'references' : references_json(root_references)
-            },
-            'version' : __version__
-        }
-
-        return serialize_json(json, indent=indent)
+        return serialize_json(self._to_json_like(), indent=indent)
 
     def validate(self):
         ''' Perform integrity checks on the modes in this document.
@@ -887,7 +888,7 @@ class Document(object):
             None
 
         '''
-        for r in self.roots:
+        for r in self._roots:
             refs = r.references()
             check_integrity(refs)
 
@@ -953,13 +954,11 @@ class Document(object):
         # we have to remove ALL roots before adding any
         # to the new doc or else models referenced from multiple
         # roots could be in both docs at once, which isn't allowed.
-        roots = []
+        roots = list(self._roots)
         self._push_all_models_freeze()
         try:
-            while self.roots:
-                r = next(iter(self.roots))
+            for r in roots:
                 self.remove_root(r)
-                roots.append(r)
         finally:
             self._pop_all_models_freeze()
         for r in roots:
@@ -976,6 +975,9 @@ class Document(object):
         '''
 
         '''
+        # some model in the graph changed its references, so any cached
+        # per-root reference sets may be stale
+        self._root_refs_cache.clear()
 
         # if freeze count is > 0, we'll recompute on unfreeze
         if self._all_models_freeze_count == 0:
@@ -1003,6 +1005,13 @@ class Document(object):
             if new is not None:
                 self._all_models_by_name.add_value(new, model)
 
+        # with no document callbacks and no hold, nothing can observe the
+        # event, so skip serializing the new value and building the event
+        if not self._callbacks_list and self._hold is None:
+            if callback_invoker is not None:
+                self._with_self_as_curdoc(callback_invoker)
+            return
+
         if hint is None:
             serializable_new = model.lookup(attr).serializable_value(model)
         else:
@@ -1029,26 +1038,39 @@ class Document(object):
         '''
 
         '''
-        new_all_models_set = set()
-        for r in self.roots:
-            new_all_models_set = new_all_models_set.union(r.references())
+        # only roots added since the last invalidation need to be walked,
+        # the reference sets for all other roots are reused from the cache
+        root_refs_cache = self._root_refs_cache
+        root_refs = []
+        for r in self._roots:
+            refs = root_refs_cache.get(id(r))
+            if refs is None:
+                refs = root_refs_cache[id(r)] = frozenset(r.references())
+            root_refs.append(refs)
+        new_all_models_set = set().union(*root_refs)
         old_all_models_set = set(self._all_models.values())
         to_detach = old_all_models_set - new_all_models_set
         to_attach = new_all_models_set - old_all_models_set
 
-        recomputed = {}
-        recomputed_by_name = MultiValuedDict()
-        for m in new_all_models_set:
-            recomputed[m.id] = m
-            if m.name is not None:
-                recomputed_by_name.add_value(m.name, m)
+        # rebind rather than update in place, select() may be lazily iterating
+        # over the previous index while models are being modified
+        self._all_models = {m.id: m for m in new_all_models_set}
+
+        # name changes on models that stay in the document are already tracked
+        # by _notify_change, so only the models that come and go need updating
+        by_name = self._all_models_by_name
+        for d in to_detach:
+            if d.name is not None:
+                by_name.remove_value(d.name, d)
+        for a in to_attach:
+            if a.name is not None:
+                by_name.add_value(a.name, a)
+
         for d in to_detach:
             self._all_former_model_ids.add(d.id)
             d._detach_document()
         for a in to_attach:
             a._attach_document(self)
-        self._all_models = recomputed
-        self._all_models_by_name = recomputed_by_name
 
     def _remove_session_callback(self, callback_obj, originator):
         ''' Remove a callback added earlier with ``add_periodic_callback``,
@@ -1087,6 +1109,28 @@ class Document(object):
             self._title = title
             self._trigger_on_change(TitleChangedEvent(self, title, setter))
 
+    def _to_json_like(self):
+        ''' Return a dictionary representing this document, whose values
+        may still contain types that need further conversion to be plain JSON
+        (e.g. NumPy arrays).
+
+        Returns:
+            dict
+
+        '''
+        root_ids = [r.id for r in self._roots]
+
+        root_references = self._all_models.values()
+
+        return {
+            'title' : self.title,
+            'roots' : {
+                'root_ids' : root_ids,
+                'references' : references_json(root_references)
+            },
+            'version' : __version__
+        }
+
     def _trigger_on_change(self, event):
         '''
 
@@ -1101,23 +1145,34 @@ class Document(object):
         if event.callback_invoker is not None:
             self._with_self_as_curdoc(event.callback_invoker)
 
-        def invoke_callbacks():
-            for cb in self._callbacks.values():
-                cb(event)
-        self._with_self_as_curdoc(invoke_callbacks)
+        curdoc, set_curdoc = _curdoc_functions()
+        old_doc = curdoc()
+        try:
+            set_curdoc(self)
+            # receivers added with on_change_dispatch_to are stored bare and
+            # dispatched to directly, rather than through a wrapper function.
+            # The tuple is replaced (never mutated) when callbacks are added or
+            # removed, so callbacks that do so here do not affect this dispatch
+            for cb, is_receiver in self._callbacks_list:
+                if is_receiver:
+                    event.dispatch(cb)
+                else:
+                    cb(event)
+        finally:
+            set_curdoc(old_doc)
 
-    def _with_self_as_curdoc(self, f):
+    def _with_self_as_curdoc(self, f, *args, **kwargs):
         '''
 
         '''
-        from bokeh.io.doc import set_curdoc, curdoc
+        curdoc, set_curdoc = _curdoc_functions()
         old_doc = curdoc()
         try:
             if getattr(f, "nolock", False):
                 set_curdoc(UnlockedDocumentProxy(self))
             else:
                 set_curdoc(self)
-            return f()
+            return f(*args, **kwargs)
         finally:
             set_curdoc(old_doc)
 
@@ -1125,14 +1180,9 @@ class Document(object):
         '''
 
         '''
-        doc = self
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            @wraps(f)
-            def invoke():
-                return f(*args, **kwargs)
-            return doc._with_self_as_curdoc(invoke)
-        return wrapper
+        # a partial avoids creating a new closure every time the callback
+        # runs, and update_wrapper carries over attributes such as "nolock"
+        return update_wrapper(partial(self._with_self_as_curdoc, f), f)
 
 
 def _combine_document_events(new_event, old_events):
@@ -1168,6 +1218,21 @@ def _combine_document_events(new_event, old_events):
 # Private API
 #-----------------------------------------------------------------------------
 
+_curdoc_funcs = None
+
+def _curdoc_functions():
+    ''' Return the ``curdoc`` and ``set_curdoc`` functions from ``bokeh.io``.
+
+    These cannot be imported at module scope without a circular import, so
+    they are imported once, on first use, and cached after that.
+
+    '''
+    global _curdoc_funcs
+    if _curdoc_funcs is None:
+        from ..io.doc import curdoc, set_curdoc
+        _curdoc_funcs = (curdoc, set_curdoc)
+    return _curdoc_funcs
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
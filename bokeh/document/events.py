@@ -60,6 +60,8 @@ class DocumentChangedEvent(object):
 
     '''
 
+    __slots__ = ('document', 'setter', 'callback_invoker')
+
     def __init__(self, document, setter=None, callback_invoker=None):
         '''
 
@@ -109,6 +111,8 @@ class DocumentPatchedEvent(DocumentChangedEvent):
 
     '''
 
+    __slots__ = ()
+
     def dispatch(self, receiver):
         ''' Dispatch handling of this event to a receiver.
 
@@ -153,6 +157,8 @@ class ModelChangedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('model', 'attr', 'old', 'new', 'serializable_new', 'hint')
+
     def __init__(self, document, model, attr, old, new, serializable_new, hint=None, setter=None, callback_invoker=None):
         '''
 
@@ -276,14 +282,16 @@ class ModelChangedEvent(DocumentPatchedEvent):
         # remote could need, even though it could be inefficient.
         # If it turns out we need to fix this we could probably
         # do it by adding some complexity.
-        value_refs = set(collect_models(value))
-
-        # we know we don't want a whole new copy of the obj we're patching
+        #
+        # collect_models already returns a duplicate-free list, so the
+        # references are added directly rather than via an intermediate set.
+        # We know we don't want a whole new copy of the obj we're patching
         # unless it's also the new value
-        if self.model != value:
-            value_refs.discard(self.model)
-
-        references.update(value_refs)
+        model = self.model
+        if model != value:
+            references.update(m for m in collect_models(value) if m is not model)
+        else:
+            references.update(collect_models(value))
 
         return { 'kind'  : 'ModelChanged',
                  'model' : self.model.ref,
@@ -296,6 +304,8 @@ class ColumnDataChangedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('column_source', 'cols')
+
     def __init__(self, document, column_source, cols=None, setter=None, callback_invoker=None):
         '''
 
@@ -382,6 +392,8 @@ class ColumnsStreamedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('column_source', 'data', 'rollover')
+
     def __init__(self, document, column_source, data, rollover, setter=None, callback_invoker=None):
         '''
 
@@ -474,6 +486,8 @@ class ColumnsPatchedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('column_source', 'patches')
+
     def __init__(self, document, column_source, patches, setter=None, callback_invoker=None):
         '''
 
@@ -551,6 +565,8 @@ class TitleChangedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('title',)
+
     def __init__(self, document, title, setter=None, callback_invoker=None):
         '''
 
@@ -629,6 +645,8 @@ class RootAddedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('model',)
+
     def __init__(self, document, model, setter=None, callback_invoker=None):
         '''
 
@@ -692,6 +710,8 @@ class RootRemovedEvent(DocumentPatchedEvent):
 
     '''
 
+    __slots__ = ('model',)
+
     def __init__(self, document, model, setter=None, callback_invoker=None):
         '''
 
@@ -755,6 +775,8 @@ class SessionCallbackAdded(DocumentChangedEvent):
 
     '''
 
+    __slots__ = ('callback',)
+
     def __init__(self, document, callback):
         '''
 
@@ -787,6 +809,8 @@ class SessionCallbackRemoved(DocumentChangedEvent):
 
     '''
 
+    __slots__ = ('callback',)
+
     def __init__(self, document, callback):
         '''
 
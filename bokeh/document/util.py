@@ -83,7 +83,7 @@ def initialize_references_json(references_json, references, setter=None):
 
         instance.update_from_json(obj_attrs, models=references, setter=setter)
 
-def instantiate_references_json(references_json):
+def instantiate_references_json(references_json, existing_instances=None):
     ''' Given a JSON representation of all the models in a graph, return a
     dict of new model objects.
 
@@ -91,22 +91,30 @@ def instantiate_references_json(references_json):
         references_json (``JSON``)
             JSON specifying new Bokeh models to create
 
+        existing_instances (dict[str, Model], optional) :
+            A dictionary mapping model IDs to models that already exist.
+            These are used in place of creating new models for the same
+            IDs. (default: None)
+
     Returns:
         dict[str, Model]
 
     '''
 
+    if existing_instances is None:
+        existing_instances = {}
+
     # Create all instances, but without setting their props
     references = {}
     for obj in references_json:
         obj_id = obj['id']
-        obj_type = obj.get('subtype', obj['type'])
+        if obj_id in existing_instances:
+            references[obj_id] = existing_instances[obj_id]
+            continue
+        obj_type = obj['subtype'] if 'subtype' in obj else obj['type']
 
-        cls = get_class(obj_type)
-        instance = cls.__new__(cls, id=obj_id)
-        if instance is None:
-            raise RuntimeError('Error loading model from JSON (type: %s, id: %s)' % (obj_type, obj_id))
-        references[instance.id] = instance
+        model_cls = get_class(obj_type)
+        references[obj_id] = model_cls.__new__(model_cls, id=obj_id)
 
     return references
 
@@ -125,6 +133,7 @@ def references_json(references):
 
     references_json = []
     for r in references:
+        # struct is a new dict on every access, so it is safe to fill in
         struct = r.struct
         struct['attributes'] = r._to_json_like(include_defaults=False)
         references_json.append(struct)
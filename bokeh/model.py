@@ -206,7 +206,8 @@ class Model(HasProps, PropertyCallbackManager, EventCallbackManager):
 
     def __new__(cls, *args, **kwargs):
         obj =  super().__new__(cls)
-        obj._id = kwargs.pop("id", make_id())
+        # avoid generating an ID that is just thrown away if one is given
+        obj._id = kwargs.pop("id") if "id" in kwargs else make_id()
         obj._document = None
         obj._temp_document = None
         return obj
@@ -19,8 +19,10 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+from itertools import count
+
 # Bokeh imports
-from ..util.serialization import make_id
 from ..util.tornado import _CallbackGroup
 
 #-----------------------------------------------------------------------------
@@ -54,7 +56,7 @@ class SessionCallback(object):
             id (str, optional) :
 
         '''
-        self._id = make_id() if id is None else id
+        self._id = _make_callback_id() if id is None else id
         self._document = document
         self._callback = callback
 
@@ -170,6 +172,14 @@ class TimeoutCallback(SessionCallback):
 # Private API
 #-----------------------------------------------------------------------------
 
+# Callback IDs never leave the process, so a simple counter is sufficient. The
+# prefix keeps them distinct from IDs generated by make_id, which may be used
+# for other callbacks in the same _CallbackGroup.
+_callback_ids = count()
+
+def _make_callback_id():
+    return "cb%d" % next(_callback_ids)
+
 class _DocumentCallbackGroup(object):
     '''
 
@@ -33,7 +33,8 @@ __all__ = (
 class MultiValuedDict(object):
     ''' Store a mapping from keys to multiple values with minimal overhead.
 
-    Avoids storing empty collecctions.
+    Avoids storing empty collecctions. A key with a single value stores the
+    bare value, and a key with several values stores them in a list.
 
     '''
 
@@ -53,16 +54,17 @@ class MultiValuedDict(object):
         if value is None:
             raise ValueError("Can't put None in this dict")
 
-        if isinstance(value, set):
-            raise ValueError("Can't put sets in this dict")
+        if isinstance(value, list):
+            raise ValueError("Can't put lists in this dict")
 
         existing = self._dict.get(key)
         if existing is None:
             self._dict[key] = value
-        elif isinstance(existing, set):
-            existing.add(value)
-        else:
-            self._dict[key] = set([existing, value])
+        elif type(existing) is list:
+            if value not in existing:
+                existing.append(value)
+        elif existing != value:
+            self._dict[key] = [existing, value]
 
     def get_all(self, k):
         '''
@@ -71,23 +73,25 @@ class MultiValuedDict(object):
         existing = self._dict.get(k)
         if existing is None:
             return []
-        elif isinstance(existing, set):
+        elif type(existing) is list:
+            # copy, since callers may change names (and so this dict) while
+            # iterating over the result
             return list(existing)
         else:
             return [existing]
 
     def get_one(self, k, duplicate_error):
-        '''
+        ''' Return the single value for a key, or ``None`` if there is none.
+
+        ``duplicate_error`` is a ``%``-format string for the key, used for the
+        error raised if there are several values. It is only formatted when
+        that error is actually raised.
 
         '''
         existing = self._dict.get(k)
-        if isinstance(existing, set):
-            if len(existing) == 1:
-                return next(iter(existing))
-            else:
-                raise ValueError(duplicate_error + (": %r" % (existing)))
-        else:
-            return existing
+        if type(existing) is list:
+            raise ValueError((duplicate_error % (k,)) + (": %r" % (existing)))
+        return existing
 
     def remove_value(self, key, value):
         '''
@@ -97,10 +101,11 @@ class MultiValuedDict(object):
             raise ValueError("Key is None")
 
         existing = self._dict.get(key)
-        if isinstance(existing, set):
-            existing.discard(value)
-            if len(existing) == 0:
-                del self._dict[key]
+        if type(existing) is list:
+            if value in existing:
+                existing.remove(value)
+            if len(existing) == 1:
+                self._dict[key] = existing[0]
         elif existing == value:
             del self._dict[key]
         else:
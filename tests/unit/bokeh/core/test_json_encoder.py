@@ -18,6 +18,7 @@ import pytest ; pytest
 import datetime as dt
 import decimal
 from collections import deque
+from enum import Enum
 
 # External imports
 import dateutil.relativedelta as rd
@@ -35,6 +36,9 @@ from bokeh.models import Range1d
 # Setup
 #-----------------------------------------------------------------------------
 
+class _StrEnum(str, Enum):
+    a = "aval"
+
 #-----------------------------------------------------------------------------
 # General API
 #-----------------------------------------------------------------------------
@@ -276,6 +280,44 @@ class TestSerializeJson(object):
         with pytest.raises(ValueError):
             self.serialize([1], sort_keys=False)
 
+class TestToJsonTypes(object):
+
+    def setup_method(self, test_method):
+        from bokeh.core.json_encoder import serialize_json, to_json_types
+        from json import loads
+        self.convert = to_json_types
+        self.roundtrip = lambda obj: loads(serialize_json(obj))
+
+    @pytest.mark.parametrize('obj', [
+        {'test': [1, 2, 3]},
+        {'a': (1, 2.5), 'b': None, 'c': True, 'd': "str"},
+        {1: 'int', 2: 'int'},
+        {2.5: 'float'},
+        {True: 'bool'},
+        {None: 'none'},
+        [np.arange(3), np.array([1.5, 2.5]), np.float64(1.5), np.int32(2), np.bool_(True)],
+        deque([0, 1, 2]),
+        [slice(0, 10, 2), decimal.Decimal(1.5), dt.date(2017, 1, 1)],
+        {'range': Range1d(start=0, end=10), 'color': RGB(16, 32, 64)},
+        {'enum': _StrEnum.a},
+        {_StrEnum.a: 'enum'},
+    ])
+    def test_matches_serialize_json(self, obj):
+        assert self.convert(obj) == self.roundtrip(obj)
+
+    def test_plain_types(self):
+        value = {'a': [1, 2.5, "s", None, False]}
+        assert self.convert(value) == value
+
+    @pytest.mark.parametrize('obj', [float("nan"), [float("inf")], {"a": np.float64("-inf")}, {float("nan"): 1}])
+    def test_nans_and_infs(self, obj):
+        with pytest.raises(ValueError):
+            self.convert(obj)
+
+    def test_bad_type(self):
+        with pytest.raises(TypeError):
+            self.convert(object())
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
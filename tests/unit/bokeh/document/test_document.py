@@ -20,6 +20,7 @@ import logging
 from copy import copy
 
 # External imports
+import numpy as np
 from mock import patch
 
 # Bokeh imports
@@ -221,6 +222,42 @@ class TestDocument(object):
         d.remove_root(m)
         assert len(d._all_models) == 0
 
+    def test_all_models_reuses_cached_root_references(self):
+        d = document.Document()
+        root1 = SomeModelInTestDocument()
+        root2 = SomeModelInTestDocument()
+        child1 = AnotherModelInTestDocument()
+        root1.child = child1
+        d.add_root(root1)
+        refs1 = d._root_refs_cache[id(root1)]
+        assert refs1 == {root1, child1}
+        d.add_root(root2)
+        assert d._root_refs_cache[id(root1)] is refs1
+        assert len(d._all_models) == 3
+        root2.child = child1
+        assert d._root_refs_cache[id(root1)] is not refs1
+        assert d._root_refs_cache[id(root2)] == {root2, child1}
+        d.remove_root(root1)
+        assert id(root1) not in d._root_refs_cache
+        assert len(d._all_models) == 2
+
+    def test_select_while_changing_references(self):
+        d = document.Document()
+        d.add_root(SomeModelInTestDocument())
+        d.add_root(SomeModelInTestDocument())
+        for m in d.select({'type': SomeModelInTestDocument}):
+            m.child = AnotherModelInTestDocument()
+        assert len(d._all_models) == 4
+        assert len(list(d.select({'type': AnotherModelInTestDocument}))) == 2
+
+    def test_set_select_while_changing_references(self):
+        d = document.Document()
+        d.add_root(SomeModelInTestDocument())
+        d.add_root(SomeModelInTestDocument())
+        d.set_select({'type': SomeModelInTestDocument}, {'child': AnotherModelInTestDocument()})
+        assert len(d._all_models) == 3
+        assert len(list(d.select({'type': AnotherModelInTestDocument}))) == 1
+
     def test_get_model_by_id(self):
         d = document.Document()
         assert not d.roots
@@ -250,6 +287,36 @@ class TestDocument(object):
         assert d.get_model_by_name(m2.name) == m2
         assert d.get_model_by_name("not a valid name") is None
 
+    def test_get_model_by_name_duplicates(self):
+        d = document.Document()
+        d.add_root(SomeModelInTestDocument(name="foo"))
+        d.add_root(SomeModelInTestDocument(name="foo"))
+        with pytest.raises(ValueError) as e:
+            d.get_model_by_name("foo")
+        assert str(e.value).startswith("Found more than one model named 'foo': ")
+
+    def test_get_model_by_name_after_roots_change(self):
+        d = document.Document()
+        root1 = SomeModelInTestDocument(name="root1")
+        root2 = SomeModelInTestDocument(name="root2")
+        child1 = AnotherModelInTestDocument(name="child1")
+        root1.child = child1
+        root2.child = child1
+        d.add_root(root1)
+        d.add_root(root2)
+        assert len(d._all_models_by_name._dict) == 3
+        d.remove_root(root1)
+        assert d.get_model_by_name("root1") is None
+        assert d.get_model_by_name("child1") is child1
+        child1.name = "renamed"
+        root2.child = None
+        assert d.get_model_by_name("renamed") is None
+        assert d.get_model_by_name("child1") is None
+        d.add_root(root1)
+        assert d.get_model_by_name("root1") is root1
+        assert d.get_model_by_name("renamed") is child1
+        assert len(d._all_models_by_name._dict) == 3
+
     def test_get_model_by_changed_name(self):
         d = document.Document()
         m = SomeModelInTestDocument(name="foo")
@@ -325,8 +392,13 @@ class TestDocument(object):
         assert set() == set(root3.select(dict(name='a')))
         assert set([child3]) == set(root3.select(dict(name='c')))
 
+        # select() by id
+        assert [root3] == d.select(dict(id=root3.id))
+        assert [] == d.select(dict(id='nope'))
+
         # select_one()
         assert root3 == d.select_one(dict(name='d'))
+        assert root3 == d.select_one(dict(id=root3.id))
         assert None == d.select_one(dict(name='nope'))
         got_error = False
         try:
@@ -520,6 +592,57 @@ class TestDocument(object):
         m.bar = 43
         assert len(events) == 1
 
+    def test_change_notification_dispatch_to(self):
+        d = document.Document()
+        m = AnotherModelInTestDocument()
+        d.add_root(m)
+        events = []
+        class Receiver(object):
+            def _document_patched(self, event):
+                events.append(event)
+        receiver = Receiver()
+        d.on_change_dispatch_to(receiver)
+        d.on_change_dispatch_to(receiver)
+        assert len(d._callbacks_list) == 1
+        m.bar = 42
+        assert len(events) == 1
+        assert events[0].new == 42
+        d.remove_on_change(receiver)
+        assert d._callbacks_list == ()
+        m.bar = 43
+        assert len(events) == 1
+
+    def test_change_notification_removing_callback(self):
+        d = document.Document()
+        m = AnotherModelInTestDocument()
+        d.add_root(m)
+        called = []
+        def once(event):
+            called.append('once')
+            d.remove_on_change(once)
+        def other(event):
+            called.append('other')
+        d.on_change(once, other)
+        m.bar = 42
+        assert called == ['once', 'other']
+        m.bar = 43
+        assert called == ['once', 'other', 'other']
+
+    @patch("bokeh.document.document.ModelChangedEvent")
+    def test_change_notification_without_listeners(self, mock_event):
+        d = document.Document()
+        m = AnotherModelInTestDocument(name="foo")
+        d.add_root(m)
+        values = []
+        def model_listener(attr, old, new):
+            values.append((new, curdoc()))
+        m.on_change('bar', model_listener)
+        m.bar = 42
+        m.name = "bar"
+        assert values == [(42, d)]
+        assert d.get_model_by_name("bar") is m
+        assert mock_event.call_count == 0
+
     def test_notification_of_roots(self):
         d = document.Document()
         assert not d.roots
@@ -772,6 +895,15 @@ class TestDocument(object):
         json = d.to_json()
         assert json['version'] == __version__
 
+    def test_to_json_matches_to_json_string(self):
+        d = document.Document()
+        d.title = "Foo"
+        source = ColumnDataSource(data=dict(x=np.arange(3), y=[1.5, 2.5, 3.5]))
+        root1 = SomeModelInTestDocument(foo=42, child=SomeModelInTestDocument(foo=43))
+        d.add_root(source)
+        d.add_root(root1)
+        assert d.to_json() == json.loads(d.to_json_string())
+
     def test_patch_integer_property(self):
         d = document.Document()
         assert not d.roots
@@ -891,6 +1023,22 @@ class TestDocument(object):
         assert child2.id not in d._all_models
         assert child3.id not in d._all_models
 
+    def test_patch_reference_property_reuses_existing_model(self):
+        d = document.Document()
+        root1 = SomeModelInTestDocument(foo=42)
+        root2 = SomeModelInTestDocument(foo=43)
+        child1 = SomeModelInTestDocument(foo=44)
+        root2.child = child1
+        d.add_root(root1)
+        d.add_root(root2)
+
+        event1 = ModelChangedEvent(d, root1, 'child', root1.child, child1, child1)
+        patch1, buffers = process_document_events([event1])
+        with patch("bokeh.document.util.get_class") as mock_get_class:
+            d.apply_json_patch_string(patch1)
+        assert mock_get_class.call_count == 0
+        assert root1.child is child1
+
     def test_patch_two_properties_at_once(self):
         d = document.Document()
         assert not d.roots
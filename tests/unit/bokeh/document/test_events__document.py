@@ -499,6 +499,12 @@ class TestSessionCallbackRemoved(object):
         e2 = bde.SessionCallbackAdded("doc", "setter")
         assert e.combine(e2) == False
 
+# All events ------------------------------------------------------------------
+
+@pytest.mark.parametrize('cls', [getattr(bde, name) for name in bde.__all__])
+def test_events_have_no_instance_dict(cls):
+    assert not hasattr(cls.__new__(cls), '__dict__')
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
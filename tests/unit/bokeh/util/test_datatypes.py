@@ -0,0 +1,89 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2019, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Module under test
+import bokeh.util.datatypes as bud # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+class Test_MultiValuedDict(object):
+
+    def test_bad_values(self):
+        d = bud.MultiValuedDict()
+        with pytest.raises(ValueError):
+            d.add_value(None, 1)
+        with pytest.raises(ValueError):
+            d.add_value("foo", None)
+        with pytest.raises(ValueError):
+            d.add_value("foo", [1, 2])
+        with pytest.raises(ValueError):
+            d.remove_value(None, 1)
+
+    def test_single_value(self):
+        d = bud.MultiValuedDict()
+        assert d.get_one("foo", "dupe %s") is None
+        assert d.get_all("foo") == []
+        d.add_value("foo", 1)
+        d.add_value("foo", 1)
+        assert d._dict == dict(foo=1)
+        assert d.get_one("foo", "dupe %s") == 1
+        assert d.get_all("foo") == [1]
+        d.remove_value("foo", 1)
+        assert d._dict == {}
+
+    def test_multiple_values(self):
+        d = bud.MultiValuedDict()
+        d.add_value("foo", 1)
+        d.add_value("foo", 2)
+        d.add_value("foo", 2)
+        d.add_value("foo", 3)
+        assert d.get_all("foo") == [1, 2, 3]
+        with pytest.raises(ValueError) as e:
+            d.get_one("foo", "dupe %s")
+        assert str(e.value) == "dupe foo: [1, 2, 3]"
+
+        d.remove_value("foo", 2)
+        d.remove_value("foo", 4)
+        assert d.get_all("foo") == [1, 3]
+        d.remove_value("foo", 1)
+        assert d._dict == dict(foo=3)
+        assert d.get_one("foo", "dupe %s") == 3
+
+    def test_get_all_returns_copy(self):
+        d = bud.MultiValuedDict()
+        d.add_value("foo", 1)
+        d.add_value("foo", 2)
+        for value in d.get_all("foo"):
+            d.remove_value("foo", value)
+        assert d._dict == {}
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------